@@ -58,11 +58,15 @@
 """
 
 import Domoticz
+import random
 import socket
 import struct
 import time
-from translations import Language, TRANSLATIONS
-from typing import Dict, List, Optional
+from collections.abc import Mapping
+from contextlib import suppress
+from functools import lru_cache
+from translations import Language, TRANSLATION_ENTRIES, TRANSLATION_RANGES
+from typing import Dict, List
 
 # Debug level constants
 DEBUG_NONE = 0                   # 0000 0000 - No debugging
@@ -96,6 +100,51 @@ SOCKET_COMMANDS = {
     'READ_VISIBI': 3005   # Read visibility settings
 }
 
+# Frozen command codes so the send/receive paths don't re-index
+# SOCKET_COMMANDS on every message
+# Upper bound (seconds) for the full-jitter delay before a reconnect retry
+_RETRY_BACKOFF = 0.5
+
+# The two readouts every heartbeat fetches, in protocol order
+_POLL_COMMANDS = ('READ_CALCUL', 'READ_PARAMS')
+
+_CMD_WRIT_PARAMS = SOCKET_COMMANDS['WRIT_PARAMS']
+_CMD_READ_PARAMS = SOCKET_COMMANDS['READ_PARAMS']
+_CMD_READ_CALCUL = SOCKET_COMMANDS['READ_CALCUL']
+
+# Precompiled wire formats for the big-endian int32 protocol; compiling the
+# format strings once avoids re-parsing them on every send/receive
+_INT32 = struct.Struct('!i')
+_INT32_2 = struct.Struct('!ii')
+_INT32_3 = struct.Struct('!iii')
+
+
+@lru_cache(maxsize=8)
+def _payload_struct(length: int) -> struct.Struct:
+    """Return a cached Struct decoding a payload of length int32 values"""
+    return struct.Struct(f'!{length}i')
+
+
+# Precompiled dispatch table for log_debug: level -> (prefix, goes_to_status).
+# Basic and device messages go to Status (blue) for visibility, the more
+# technical categories go to Debug (grey).
+_DEBUG_DISPATCH = {
+    DEBUG_BASIC: ('[BASIC]  ', True),
+    DEBUG_DEVICE: ('[DEVICE] ', True),
+    DEBUG_CONN: ('[CONN]   ', False),
+    DEBUG_PROTO: ('[PROTO]  ', False),
+    DEBUG_DATA: ('[DATA]   ', False),
+}
+
+# Human-readable names for the debug categories, decoded once at startup
+_DEBUG_CATEGORY_NAMES = (
+    (DEBUG_BASIC, "Basic"),
+    (DEBUG_DEVICE, "Device"),
+    (DEBUG_CONN, "Connection"),
+    (DEBUG_PROTO, "Protocol"),
+    (DEBUG_DATA, "Data Processing"),
+)
+
 
 def log_debug(message, level, current_debug_level):
     """
@@ -110,29 +159,19 @@ def log_debug(message, level, current_debug_level):
 
         # If DEBUG_ALL is set, log everything as Debug
         if current_debug_level == DEBUG_ALL:
-            Domoticz.Debug(f"[ALL] {message}")
+            Domoticz.Debug("[ALL] " + message)
             return
 
-        # Handle specific debug levels with different Domoticz log types
-        if level == DEBUG_BASIC and (current_debug_level & DEBUG_BASIC):
-            # Basic info goes to Status (blue) for better visibility
-            Domoticz.Status(f"[BASIC]  {message}")
-
-        elif level == DEBUG_DEVICE and (current_debug_level & DEBUG_DEVICE):
-            # Device updates go to Status (blue) as they're important operational info
-            Domoticz.Status(f"[DEVICE] {message}")
-
-        elif level == DEBUG_CONN and (current_debug_level & DEBUG_CONN):
-            # Connection info goes to Debug (grey) as it's more technical
-            Domoticz.Debug(f"[CONN]   {message}")
-
-        elif level == DEBUG_PROTO and (current_debug_level & DEBUG_PROTO):
-            # Protocol details go to Debug (grey) as they're technical details
-            Domoticz.Debug(f"[PROTO]  {message}")
+        # Single table lookup plus one bitmask test instead of an if/elif ladder
+        entry = _DEBUG_DISPATCH.get(level)
+        if entry is None or not (current_debug_level & level):
+            return
 
-        elif level == DEBUG_DATA and (current_debug_level & DEBUG_DATA):
-            # Data processing goes to Debug (grey) as it's technical detail
-            Domoticz.Debug(f"[DATA]   {message}")
+        prefix, to_status = entry
+        if to_status:
+            Domoticz.Status(prefix + message)
+        else:
+            Domoticz.Debug(prefix + message)
 
     except Exception as e:
         # Fallback logging if something goes wrong - use Error level for visibility
@@ -144,13 +183,10 @@ class DeviceUpdateTracker:
         self.last_update_times = {}
         self.graph_update_interval = 300  # 5 minutes in seconds
         self.device_types = {}
-
-        self.type_mapping = {
-            80: ('Temperature', True),
-            243: ('Custom', True),
-            242: ('Custom', True),
-            244: ('Switch', False)
-        }
+        # device_id -> (raw sValue, normalized sValue); a device's current
+        # value only changes when we push an update, so the normalization
+        # from the previous poll can be reused until the raw string differs
+        self._norm_cache = {}
 
     def _check_device_type(self, device) -> bool:
         """Get cached device type information or check and cache if not present.
@@ -166,10 +202,17 @@ class DeviceUpdateTracker:
                 return False
 
             if device_id not in self.device_types:
-                # Look up the device type in our mapping.
-                device_info = self.type_mapping.get(
-                    device.Type, ('Unknown', False))
-                type_name, is_graphing = device_info
+                # Only four Domoticz types occur here; a small if/elif
+                # chain beats a dict lookup plus tuple unpack
+                dev_type = device.Type
+                if dev_type == 80:
+                    type_name, is_graphing = 'Temperature', True
+                elif dev_type == 243 or dev_type == 242:
+                    type_name, is_graphing = 'Custom', True
+                elif dev_type == 244:
+                    type_name, is_graphing = 'Switch', False
+                else:
+                    type_name, is_graphing = 'Unknown', False
 
                 if _plugin.debug_level & DEBUG_DEVICE:
                     type_info = f"Device {device_id} ({device.Name}) - Type: {device.Type} ({type_name})"
@@ -196,57 +239,68 @@ class DeviceUpdateTracker:
         if not value_str:
             return ""
 
-        # Trim whitespace and use only the first part if a ';' is present.
-        value_str = value_str.strip()
-        if ';' in value_str:
-            value_str = value_str.split(';')[0].strip()
+        # Use only the first part if a ';' is present; partition does it
+        # in a single pass without allocating a list
+        value_str = value_str.partition(';')[0].strip()
 
-        try:
-            float_value = float(value_str)
-            # Determine the number of decimals in the original string (at least one)
-            if '.' in value_str:
-                decimals = len(value_str.split('.')[1])
-                decimals = max(decimals, 1)
-            else:
-                decimals = 1
-            return f"{float_value:.{decimals}f}"
-        except ValueError:
+        # Cheap numeric pre-check so text states don't pay for a raised
+        # and caught ValueError on every poll
+        unsigned = value_str[1:] if value_str[:1] in '+-' else value_str
+        if not unsigned or not unsigned.replace('.', '', 1).isdigit():
             return value_str.lower()
 
-    def needs_update(self, device, new_values) -> tuple[bool, str, str]:
+        # Determine the number of decimals in the original string (at least one)
+        integer_part, dot, fraction = value_str.partition('.')
+        decimals = max(len(fraction), 1) if dot else 1
+        return f"{float(value_str):.{decimals}f}"
+
+    def needs_update(self, device, n_value, s_value) -> tuple[bool, str, str]:
         """
-        Determine if a device needs an update based on its type and new values.
+        Determine if a device needs an update based on its type and the
+        incoming nValue/sValue pair.
         Returns a tuple of:
         (needs_update, update_reason, diff_message)
         where diff_message details any numeric or text differences.
         """
         try:
-            current_time = time.time()
+            # Monotonic clock: immune to NTP/system clock jumps and
+            # slightly cheaper than time.time() on most platforms
+            current_time = time.monotonic()
             device_id = device.ID
             is_graphing = self._check_device_type(device)
 
             # Get current values from the device.
-            current_values = {
-                'nValue': device.nValue,
-                'sValue': str(device.sValue)
-            }
+            current_n = device.nValue
+            current_s = device.sValue
 
             values_changed = False
             diff_message = ""
 
-            # Compare numeric value (nValue) directly.
-            if 'nValue' in new_values and new_values['nValue'] != current_values['nValue']:
-                values_changed = True
-                diff_message += f"nValue: {current_values['nValue']} -> {new_values['nValue']}; "
+            # Fast path: identical raw values cannot differ after
+            # normalization, so the steady state (most sensors, most
+            # polls) is two plain comparisons before the interval check
+            raw_equal = n_value == current_n and s_value == current_s
 
-            # Compare sValue using normalized comparison.
-            if 'sValue' in new_values:
-                norm_current = self._normalize_value(current_values['sValue'])
-                norm_new = self._normalize_value(new_values['sValue'])
+            if not raw_equal:
+                # Compare numeric value (nValue) directly.
+                if n_value != current_n:
+                    values_changed = True
+                    diff_message += f"nValue: {current_n} -> {n_value}; "
+
+                # Compare sValue using normalized comparison; the current
+                # value is normalized once and cached until the raw string
+                # changes.
+                cached = self._norm_cache.get(device_id)
+                if cached is not None and cached[0] == current_s:
+                    norm_current = cached[1]
+                else:
+                    norm_current = self._normalize_value(current_s)
+                    self._norm_cache[device_id] = (current_s, norm_current)
+                norm_new = self._normalize_value(s_value)
                 if norm_current != norm_new:
                     values_changed = True
-                    diff_message += (f"sValue: {current_values['sValue']} (normalized: {norm_current}) -> "
-                                     f"{new_values['sValue']} (normalized: {norm_new})")
+                    diff_message += (f"sValue: {current_s} (normalized: {norm_current}) -> "
+                                     f"{s_value} (normalized: {norm_new})")
 
             if values_changed:
                 if is_graphing:
@@ -272,23 +326,41 @@ class DeviceUpdateTracker:
             return False, f"Error: {str(e)}", ""
 
 
+# Shared zero-power result; update_device only reads from it, so all
+# callbacks can hand out the same dict
+_ZERO_POWER = {'sValue': "0.0"}
+
+# Constant Options dicts shared across device definitions instead of being
+# reallocated for every unit in prepare_devices_list
+_OPT_ENERGY_COMPUTED = {'EnergyMeterMode': '1'}
+_OPT_CUSTOM_K = {'Custom': '1;K'}
+_OPT_CUSTOM_BAR = {'Custom': '1;bar'}
+
+# Shared zero-COP result for to_cop_calculator's idle branch
+_COP_ZERO = {'sValue': '0'}
+
+
 # Read callbacks
 def to_float(data_list: list, data_idx: int, divider: float) -> dict:
     """Convert data to float with divider"""
-    converted = float(data_list[data_idx] / divider)
-    return {'sValue': str(converted)}
+    # True division already yields a float; no extra float() wrapper needed
+    return {'sValue': str(data_list[data_idx] / divider)}
 
 
 def to_number(data_list: list, data_idx: int, divider: float = 1.0) -> dict:
     """Convert data to number with optional divider"""
-    converted = float(data_list[data_idx] / divider)
-    return {'nValue': int(converted)}
+    return {'nValue': int(data_list[data_idx] / divider)}
+
 
+def selector_level_map(values: list) -> dict:
+    """Build the value -> selector level dict for a write parameter"""
+    return {value: index * 10 for index, value in enumerate(values)}
 
-def selector_switch_level_mapping(data_list: list, data_idx: int, mapping: list) -> dict:
-    """Map data to selector switch levels"""
-    level = mapping.index(data_list[data_idx]) * 10
-    return {'nValue': int(level), 'sValue': str(level)}
+
+def selector_switch_level_mapping(data_list: list, data_idx: int, mapping: dict) -> dict:
+    """Map data to selector switch levels via a precomputed value -> level dict"""
+    level = mapping[data_list[data_idx]]
+    return {'nValue': level, 'sValue': str(level)}
 
 
 def to_instant_power(data_list: list, power_data_idx: int, *_args) -> dict:
@@ -311,7 +383,7 @@ def to_instant_power(data_list: list, power_data_idx: int, *_args) -> dict:
     except Exception as e:
         log_debug(
             f"Error in to_instant_power: {str(e)}", DEBUG_DATA, _plugin.debug_level)
-        return {'sValue': "0.0"}
+        return _ZERO_POWER
 
 
 def to_instant_power_split(data_list: list, power_data_idx: int, additional_data: list, *_args) -> dict:
@@ -331,17 +403,17 @@ def to_instant_power_split(data_list: list, power_data_idx: int, additional_data
         if isinstance(power_data_idx, list):
             power_data_idx = power_data_idx[0]
 
-        instant_power = float(data_list[power_data_idx])
-        current_state = int(data_list[state_idx])
+        # Share the constant zero result when the mode doesn't match
+        if data_list[state_idx] not in valid_states:
+            return _ZERO_POWER
 
-        # Return power value based on state
-        power = instant_power if current_state in valid_states else 0.0
-        return {'sValue': f"{power:.1f}"}
+        instant_power = float(data_list[power_data_idx])
+        return {'sValue': f"{instant_power:.1f}"}
 
     except Exception as e:
         log_debug(
             f"Error in to_instant_power_split: {str(e)}", DEBUG_DATA, _plugin.debug_level)
-        return {'sValue': "0.0"}
+        return _ZERO_POWER
 
 
 def to_cop_calculator(data_list: list, indices: int, *args) -> dict:
@@ -349,16 +421,36 @@ def to_cop_calculator(data_list: list, indices: int, *args) -> dict:
     indices_list = args[0]
     heat_output_idx, power_input_idx = indices_list
 
-    heat_output = float(data_list[heat_output_idx])
-    power_input = float(data_list[power_input_idx])
+    # Idle compressor: skip the conversions and hand out the shared zero
+    power_input = data_list[power_input_idx]
+    if power_input <= 0:
+        return _COP_ZERO
 
-    if power_input > 0:
-        cop = heat_output / power_input
-    else:
-        cop = 0
+    cop = data_list[heat_output_idx] / power_input
     return {'sValue': str(round(cop, 2))}
 
 
+# Translated operating-mode table for to_text_state, cached per language so
+# it is not rebuilt on every poll
+_mode_names_cache: Dict[Language, Dict[int, str]] = {}
+
+
+def _get_mode_names() -> Dict[int, str]:
+    """Return the translated operating-mode names for the current language"""
+    language = _plugin.translation_manager._current_language
+    mode_names = _mode_names_cache.get(language)
+    if mode_names is None:
+        mode_names = {
+            0: translate('Heating mode'),
+            1: translate('Hot water mode'),
+            2: translate('Swimming pool mode / Photovoltaik'),
+            3: translate('Cooling'),
+            4: translate('No requirement')
+        }
+        _mode_names_cache[language] = mode_names
+    return mode_names
+
+
 def to_text_state(data_list: list, data_idx: int, config: list) -> dict:
     """
     Converts heat pump state to text status
@@ -378,13 +470,7 @@ def to_text_state(data_list: list, data_idx: int, config: list) -> dict:
         return {'nValue': 0, 'sValue': translate('Cooling')}
     
     # Operating modes based on ID_WEB_WP_BZ_akt values
-    mode_names = {
-        0: translate('Heating mode'),
-        1: translate('Hot water mode'),
-        2: translate('Swimming pool mode / Photovoltaik'),
-        3: translate('Cooling'),
-        4: translate('No requirement')
-    }
+    mode_names = _get_mode_names()
 
     power_idx, power_threshold = config
 
@@ -434,15 +520,21 @@ def available_writes_level_with_divider(write_data_list: list, *_args,
                                         available_writes, Level, **_kwargs):
     """Returns available writes based on level and divider."""
     divider, available_writes_idx = write_data_list
-    return available_writes[available_writes_idx].get_val()[int(Level / divider)]
+    return available_writes[available_writes_idx].get_val()[int(Level) // divider]
 
 
 def level_with_divider(divider: float, *_args, Level, **_kwargs):
-    """Returns level divided by divider."""
-    return int(Level / divider)
+    """Returns level divided by divider using integer arithmetic."""
+    if divider < 1:
+        # Fractional dividers (1/10) scale the level up; multiplying by the
+        # integer reciprocal avoids float rounding like 524.999999 -> 524
+        return round(Level * round(1 / divider))
+    return int(Level) // int(divider)
 
 
 class Field:
+    __slots__ = ('name', 'vales')
+
     def __init__(self, *args, **kwargs):
         if len(args) == len(kwargs) == 0:
             self.name = 'Unknown'
@@ -457,14 +549,64 @@ class Field:
         return self.vales
 
 
+class Unit:
+    __slots__ = ('id', 'message', 'address', 'data_conversion_callback',
+                 '_read_args', 'dev_params', 'name',
+                 'write_conversion_callback', '_write_args',
+                 'update_params', 'push_update')
+
+    def __init__(self, domoticz_id, message, address, read_conversion, dev_params, name, write_conversion=None):
+        self.id = domoticz_id
+        self.message = message
+        self.address = address
+        self.data_conversion_callback, *self._read_args = read_conversion
+
+        self.dev_params = dev_params
+        self.name = name
+        if write_conversion is not None:
+            self.write_conversion_callback, *self._write_args = write_conversion
+        else:
+            self.write_conversion_callback = write_conversion
+
+        # Everything the read path needs is frozen at construction, so bind
+        # it into one closure the poll loops can call without any attribute
+        # lookups or kwargs repacking per device
+        callback = self.data_conversion_callback
+        read_args = tuple(self._read_args)
+        unit_id = self.id
+        unit_address = self.address
+
+        def push_update(data_list):
+            update_device(
+                Unit=unit_id, **callback(data_list, unit_address, *read_args))
+
+        self.push_update = push_update
+
+    def update_domoticz_dev(self, data_list):
+        self.push_update(data_list)
+
+    def prepare_data_to_send(self, **kwargs):
+        return ('WRIT_PARAMS', self.address,
+                self.write_conversion_callback(*self._write_args, **kwargs))
+
+
 class TranslationManager:
     """Manages translations for the plugin"""
 
+    __slots__ = ('_default_language', '_current_language',
+                 '_translations', '_active', '_reverse', '_ranges')
+
     def __init__(self, default_language: Language = Language.ENGLISH):
         self._default_language = default_language
         self._current_language = default_language
         self._translations: Dict[str, Dict[Language, str]] = {}
-        self._ranges: Dict[str, Dict[Language, Dict[str, str]]] = {}
+        # key -> text table for the current language (default-language
+        # fallback already applied) so get() is a single hash lookup
+        self._active: Dict[str, str] = {}
+        # Reverse translation-value -> canonical-key index so membership
+        # tests don't scan every key in every language
+        self._reverse: Dict[str, str] = {}
+        self._ranges: Dict[str, Dict[Language, str]] = {}
 
     def set_language(self, language: Language) -> None:
         """Set the current language"""
@@ -472,6 +614,16 @@ class TranslationManager:
             raise ValueError(
                 f"Invalid language type: {type(language)}. Expected Language enum.")
         self._current_language = language
+        self._rebuild_active()
+
+    def _rebuild_active(self) -> None:
+        """Rebuild the key -> text table for the current language"""
+        current = self._current_language
+        default = self._default_language
+        self._active = {
+            key: translations.get(current, translations.get(default, key))
+            for key, translations in self._translations.items()
+        }
 
     def add_translation(self, key: str, translations: Dict[Language, str]) -> None:
         """Add a translation entry"""
@@ -487,22 +639,22 @@ class TranslationManager:
             translations[Language.ENGLISH] = key
 
         self._translations[key] = translations
+        self._reverse[key] = key
+        self._active[key] = translations.get(
+            self._current_language,
+            translations.get(self._default_language, key))
+        for value in translations.values():
+            if isinstance(value, str):
+                self._reverse[value] = key
 
     def get(self, key: str) -> str:
         """Get translation for the current language"""
         if not isinstance(key, str):
             return str(key)
 
-        if key not in self._translations:
-            return key
-
-        translations = self._translations[key]
-        if self._current_language not in translations:
-            return translations.get(self._default_language, key)
+        return self._active.get(key, key)
 
-        return translations[self._current_language]
-
-    def add_range(self, key: str, ranges: Dict[Language, Dict[str, str]]) -> None:
+    def add_range(self, key: str, ranges: Dict[Language, str]) -> None:
         """Add a range entry with validation"""
         if not isinstance(key, str):
             raise ValueError(f"Range key must be string, got {type(key)}")
@@ -511,7 +663,7 @@ class TranslationManager:
             raise ValueError(f"Ranges must be dict, got {type(ranges)}")
 
         if Language.ENGLISH not in ranges:
-            ranges[Language.ENGLISH] = {'description': key}
+            ranges[Language.ENGLISH] = key
 
         self._ranges[key] = ranges
 
@@ -524,55 +676,53 @@ class TranslationManager:
             return ""
 
         ranges = self._ranges[range_key]
-        current_range = ranges.get(
-            self._current_language, ranges.get(self._default_language, {}))
-        return current_range.get('description', "")
+        return ranges.get(
+            self._current_language, ranges.get(self._default_language, ""))
 
     def bulk_add_translations(self, translations_data: Dict[str, Dict[Language, str]]) -> None:
         """Add multiple translations at once"""
-        if not isinstance(translations_data, dict):
+        # Mapping rather than dict: the module-level tables arrive as
+        # read-only mappingproxy views
+        if not isinstance(translations_data, Mapping):
             raise ValueError(
-                f"Translations data must be dict, got {type(translations_data)}")
+                f"Translations data must be a mapping, got {type(translations_data)}")
 
         for key, translations in translations_data.items():
             if key != 'ranges':  # Skip ranges key
                 self.add_translation(key, translations)
 
-    def bulk_add_ranges(self, ranges_data: Dict[str, Dict[Language, Dict[str, str]]]) -> None:
+    def bulk_add_ranges(self, ranges_data: Dict[str, Dict[Language, str]]) -> None:
         """Add multiple ranges at once"""
-        if not isinstance(ranges_data, dict):
+        if not isinstance(ranges_data, Mapping):
             raise ValueError(
-                f"Ranges data must be dict, got {type(ranges_data)}")
+                f"Ranges data must be a mapping, got {type(ranges_data)}")
 
         for key, ranges in ranges_data.items():
             self.add_range(key, ranges)
 
     def initialize_debug(self, debug_level: int) -> None:
         """Initialize debug logging after plugin is started"""
-        # Check translations for all languages
-        for lang in Language:
-            missing_translations = []
-            for key, translations in self._translations.items():
+        # Collect missing keys for every language in a single pass over the
+        # translation table instead of re-scanning it once per language
+        missing_by_lang = {lang: [] for lang in Language}
+        for key, translations in self._translations.items():
+            for lang in Language:
                 if lang not in translations:
-                    missing_translations.append(key)
+                    missing_by_lang[lang].append(key)
 
+        for lang, missing_translations in missing_by_lang.items():
             if missing_translations:
                 log_debug(f"Missing {lang.name} translations for keys: {', '.join(missing_translations)}",
                           DEBUG_BASIC, debug_level)
 
-        # Log translation coverage
-        self._check_translation_coverage(debug_level)
+        # Log translation coverage, reusing the already-collected result
+        self._check_translation_coverage(
+            debug_level, missing_by_lang[self._current_language])
 
-    def _check_translation_coverage(self, debug_level: int) -> None:
+    def _check_translation_coverage(self, debug_level: int, missing_keys: List[str]) -> None:
         """Check and log translation coverage for current language"""
-        missing_count = 0
+        missing_count = len(missing_keys)
         total_keys = len(self._translations)
-        missing_keys = []
-
-        for key, translations in self._translations.items():
-            if self._current_language not in translations:
-                missing_count += 1
-                missing_keys.append(key)
 
         if missing_count > 0:
             coverage_pct = ((total_keys - missing_count)/total_keys) * 100
@@ -586,14 +736,29 @@ class TranslationManager:
 class BasePlugin:
     def __init__(self):
         self.debug_level = DEBUG_NONE
+        self.debug_categories_label = ""
         self.active_connection = None
+        # Reusable receive buffer; grown on demand, avoids per-read allocations
+        self._recv_buf = bytearray(8192)
         self.name = None
+        self.name_prefix = ""
         self.host = None
         self.port = None
         self.devices_parameters_list = []
         self.units = {}
         self.available_writes = {}
         self.dev_lists = {}
+        self.poll_units = {}
+        # Adaptive polling: after several cycles without any device change,
+        # every other heartbeat is skipped until a value changes again
+        self._stable_cycles = 0
+        self._skip_next_poll = False
+        # The debug configuration dump is deferred to the first heartbeat
+        self._config_dumped = False
+        # Language the device list was last built for; the builder is a
+        # no-op until this goes stale
+        self._devices_list_language = None
+        self.update_tracker = DeviceUpdateTracker()
         self.translation_manager = TranslationManager()
 
         for command in SOCKET_COMMANDS.keys():
@@ -602,16 +767,23 @@ class BasePlugin:
         log_debug("Plugin initialized", DEBUG_BASIC, self.debug_level)
 
     def prepare_devices_list(self):
+        # Building the list allocates dozens of dicts and translated
+        # strings, so rebuild only when the language changed
+        current_language = self.translation_manager._current_language
+        if self.units and self._devices_list_language is current_language:
+            return
+        self._devices_list_language = current_language
+
         log_debug("Preparing devices list", DEBUG_BASIC, self.debug_level)
         self.available_writes = {
             -1: Field(),
-            1: Field(translate('Temp +-'), [a for a in range(-50, 51, 5)]),
+            1: Field(translate('Temp +-'), list(range(-50, 51, 5))),
             3: Field(translate('Heating mode'), [0, 1, 2, 3, 4]),
             4: Field(translate('Hot water mode'), [0, 1, 2, 3, 4]),
-            105: Field(translate('DHW temp target'), [a for a in range(300, 651, 5)]),
+            105: Field(translate('DHW temp target'), list(range(300, 651, 5))),
             108: Field(translate('Cooling'), [0, 1]),
             1052: Field(translate('DHW Power Mode'), [0, 1]),
-            1148: Field(translate('Room temp setpoint'), [a for a in range(150, 301, 5)])  # 15.0–30.0°C in 0.5°C steps (raw = °C*10)
+            1148: Field(translate('Room temp setpoint'), list(range(150, 301, 5)))  # 15.0–30.0°C in 0.5°C steps (raw = °C*10)
         }
         
         # Define selector options as separate lists
@@ -623,6 +795,12 @@ class BasePlugin:
             'Off'
         ]
 
+        # Translate the shared selector strings once; the heating and hot water
+        # selectors use identical options
+        heating_mode_level_actions = '|' * len(heating_mode_options)
+        heating_mode_level_names = translate_selector_options(
+            heating_mode_options)
+
         self.devices_parameters_list = [
             # Heat supply/flow temperature sensor
             ['READ_CALCUL', 10, (to_float, 10),
@@ -677,19 +855,19 @@ class BasePlugin:
              dict(TypeName='Temperature', Used=0), translate('MC2 temp target')],
 
             # Heating operation mode selector switch
-            ['READ_PARAMS', 3, (selector_switch_level_mapping, self.available_writes[3].get_val()),
+            ['READ_PARAMS', 3, (selector_switch_level_mapping, selector_level_map(self.available_writes[3].get_val())),
              dict(TypeName='Selector Switch', Image=15, Used=1,
-                  Options={'LevelActions': '|' * len(heating_mode_options),
-                           'LevelNames': translate_selector_options(heating_mode_options),
+                  Options={'LevelActions': heating_mode_level_actions,
+                           'LevelNames': heating_mode_level_names,
                            'LevelOffHidden': 'false',
                            'SelectorStyle': '1'}),
              translate('Heating mode'), (available_writes_level_with_divider, [10, 3])],
 
             # Hot water operation mode selector switch
-            ['READ_PARAMS', 4, (selector_switch_level_mapping, self.available_writes[4].get_val()),
+            ['READ_PARAMS', 4, (selector_switch_level_mapping, selector_level_map(self.available_writes[4].get_val())),
              dict(TypeName='Selector Switch', Image=15, Used=1,
-                  Options={'LevelActions': '|' * len(heating_mode_options),
-                           'LevelNames': translate_selector_options(heating_mode_options),
+                  Options={'LevelActions': heating_mode_level_actions,
+                           'LevelNames': heating_mode_level_names,
                            'LevelOffHidden': 'false',
                            'SelectorStyle': '1'}),
              translate('Hot water mode'), (available_writes_level_with_divider, [10, 4])],
@@ -731,35 +909,35 @@ class BasePlugin:
 
             # Total electrical power consumption
             ['READ_CALCUL', 268, (to_instant_power, [268]),
-             dict(TypeName='kWh', Used=1, Options={'EnergyMeterMode': '1'}),
+             dict(TypeName='kWh', Used=1, Options=_OPT_ENERGY_COMPUTED),
              translate('Power total')],
 
             # Heating mode electrical power consumption
-            ['READ_CALCUL', 268, (to_instant_power_split, [80, [0]]),
-             dict(TypeName='kWh', Used=1, Options={'EnergyMeterMode': '1'}),
+            ['READ_CALCUL', 268, (to_instant_power_split, (80, frozenset({0}))),
+             dict(TypeName='kWh', Used=1, Options=_OPT_ENERGY_COMPUTED),
              translate('Power heating')],
 
             # Hot water mode electrical power consumption
-            ['READ_CALCUL', 268, (to_instant_power_split, [80, [1]]),
-             dict(TypeName='kWh', Used=1, Options={'EnergyMeterMode': '1'}),
+            ['READ_CALCUL', 268, (to_instant_power_split, (80, frozenset({1}))),
+             dict(TypeName='kWh', Used=1, Options=_OPT_ENERGY_COMPUTED),
              translate('Power DHW')],
 
             # Total heat output power
             ['READ_CALCUL', 257, (to_instant_power, [257]),
              dict(TypeName='kWh', Switchtype=4, Image=15,
-                  Used=1, Options={'EnergyMeterMode': '1'}),
+                  Used=1, Options=_OPT_ENERGY_COMPUTED),
              translate('Heat out total')],
 
             # Heating mode heat output power
-            ['READ_CALCUL', 257, (to_instant_power_split, [80, [0]]),
+            ['READ_CALCUL', 257, (to_instant_power_split, (80, frozenset({0}))),
              dict(TypeName='kWh', Switchtype=4, Image=15,
-                  Used=1, Options={'EnergyMeterMode': '1'}),
+                  Used=1, Options=_OPT_ENERGY_COMPUTED),
              translate('Heat out heating')],
 
             # Hot water mode heat output power
-            ['READ_CALCUL', 257, (to_instant_power_split, [80, [1]]),
+            ['READ_CALCUL', 257, (to_instant_power_split, (80, frozenset({1}))),
              dict(TypeName='kWh', Switchtype=4, Image=15,
-                  Used=1, Options={'EnergyMeterMode': '1'}),
+                  Used=1, Options=_OPT_ENERGY_COMPUTED),
              translate('Heat out DHW')],
 
             # Overall system COP (Coefficient of Performance)
@@ -785,26 +963,26 @@ class BasePlugin:
 
             # Superheat monitoring
             ['READ_CALCUL', 178, (to_float, 10),
-             dict(TypeName='Custom', Used=1, Options={'Custom': '1;K'}), translate('Superheat')],
+             dict(TypeName='Custom', Used=1, Options=_OPT_CUSTOM_K), translate('Superheat')],
 
             # High pressure monitoring
             ['READ_CALCUL', 180, (to_float, 100),
-             dict(TypeName='Custom', Used=1, Options={'Custom': '1;bar'}), translate('High pressure')],
+             dict(TypeName='Custom', Used=1, Options=_OPT_CUSTOM_BAR), translate('High pressure')],
 
             # Low pressure monitoring
             ['READ_CALCUL', 181, (to_float, 100),
-             dict(TypeName='Custom', Used=1, Options={'Custom': '1;bar'}), translate('Low pressure')],
+             dict(TypeName='Custom', Used=1, Options=_OPT_CUSTOM_BAR), translate('Low pressure')],
 
             # Brine temperature difference (Source in - Source out)
             ['READ_CALCUL', [19, 20], (calculate_temp_diff, 10),
-             dict(TypeName='Custom', Used=1, Options={'Custom': '1;K'}), translate('Brine temp diff')],
+             dict(TypeName='Custom', Used=1, Options=_OPT_CUSTOM_K), translate('Brine temp diff')],
 
             # Heating temperature difference (Supply - Return)
             ['READ_CALCUL', [10, 11], (calculate_temp_diff, 10),
-             dict(TypeName='Custom', Used=1, Options={'Custom': '1;K'}), translate('Heating temp diff')],
+             dict(TypeName='Custom', Used=1, Options=_OPT_CUSTOM_K), translate('Heating temp diff')],
             
             # DHW Power Mode selector switch (0 = Normal, 1 = Luxury)
-            ['READ_PARAMS', 1052, (selector_switch_level_mapping, self.available_writes[1052].get_val()),
+            ['READ_PARAMS', 1052, (selector_switch_level_mapping, selector_level_map(self.available_writes[1052].get_val())),
                 dict(TypeName='Selector Switch', Image=15, Used=1,
                     Options={'LevelActions': '0|10',
                             'LevelNames': translate_selector_options(['Normal', 'Luxury']),
@@ -826,39 +1004,28 @@ class BasePlugin:
             ],
         ]
 
-        class Unit:
-            def __init__(self, domoticz_id, message, address, read_conversion, dev_params, name, write_conversion=None):
-                self.id = domoticz_id
-                self.message = message
-                self.address = address
-                self.data_conversion_callback, *self._read_args = read_conversion
-
-                self.dev_params = dev_params
-                self.name = name
-                if write_conversion is not None:
-                    self.write_conversion_callback, *self._write_args = write_conversion
-                else:
-                    self.write_conversion_callback = write_conversion
-
-            def update_domoticz_dev(self, data_list):
-                update_device(
-                    Unit=self.id, **self.data_conversion_callback(data_list, self.address, *self._read_args))
-
-            def prepare_data_to_send(self, **kwargs):
-                return ('WRIT_PARAMS', self.address,
-                        self.write_conversion_callback(*self._write_args, **kwargs))
-
         for dev_idx in range(len(self.devices_parameters_list)):
             tmp_unit = Unit(
                 dev_idx + 1, *self.devices_parameters_list[dev_idx])
             tmp_unit.dev_params.update(
                 dict(Name=tmp_unit.name, Unit=tmp_unit.id))
+            # Pre-split the update-only parameters so create_devices does not
+            # copy and pop per device ('Used' stays under user control)
+            tmp_unit.update_params = {
+                k: v for k, v in tmp_unit.dev_params.items() if k != 'Used'}
 
             self.units[tmp_unit.name] = tmp_unit
             self.dev_lists[tmp_unit.message][tmp_unit.id] = tmp_unit
             if tmp_unit.write_conversion_callback is not None:
                 self.dev_lists['WRIT_PARAMS'][tmp_unit.id] = tmp_unit
 
+        # Flatten the per-command device maps into tuples once, so the poll
+        # loops iterate a contiguous sequence instead of rebuilding dict views
+        self.poll_units = {
+            command: tuple(units.values())
+            for command, units in self.dev_lists.items()
+        }
+
     def _get_device_description(self, device_name: str) -> str:
         """Get range description for a device if available"""
         try:
@@ -887,6 +1054,8 @@ class BasePlugin:
 
         devices_created = 0
         devices_updated = 0
+        # Collect per-device debug lines and emit them as one log call below
+        device_log_lines = []
 
         for unit in self.units.values():
             try:
@@ -894,25 +1063,23 @@ class BasePlugin:
                 description = self._get_device_description(unit.name)
                 if description:
                     unit.dev_params['Description'] = description
+                    unit.update_params['Description'] = description
 
                 if unit.id not in Devices:
                     # Log device creation with parameters if debug is enabled
                     if self.debug_level & DEBUG_DEVICE:
                         param_info = {k: v for k, v in unit.dev_params.items()
                                       if k in ['TypeName', 'Options', 'Switchtype', 'Image']}
-                        log_debug(
-                            f"Creating device {unit.id} ({unit.name}) with parameters: {param_info}", DEBUG_DEVICE, self.debug_level)
+                        device_log_lines.append(
+                            f"Creating device {unit.id} ({unit.name}) with parameters: {param_info}")
                     Domoticz.Device(**unit.dev_params).Create()
                     devices_created += 1
                 else:
-                    # Updating existing device
-                    update_params = unit.dev_params.copy()
-                    # Don't change Used flag which can be set by user
-                    update_params.pop('Used', None)
+                    # Updating existing device with the pre-split parameters
                     if self.debug_level & DEBUG_DEVICE:
-                        log_debug(
-                            f"Updating device {unit.id} ({unit.name})", DEBUG_DEVICE, self.debug_level)
-                    update_device(**update_params)
+                        device_log_lines.append(
+                            f"Updating device {unit.id} ({unit.name})")
+                    update_device(**unit.update_params)
                     devices_updated += 1
 
             except Exception as e:
@@ -920,17 +1087,62 @@ class BasePlugin:
                 log_debug(error_msg, DEBUG_DEVICE, self.debug_level)
                 Domoticz.Error(error_msg)
 
+        if device_log_lines:
+            log_debug('\n'.join(device_log_lines),
+                      DEBUG_DEVICE, self.debug_level)
+
         # Log summary of device creation/update process
         log_debug(
             f"Device creation complete - Created: {devices_created}, Updated: {devices_updated}, Total: {total_devices}", DEBUG_BASIC, self.debug_level)
 
     def initialize_connection(self):
-        """Initialize socket connection with  logging"""
+        """Initialize socket connection with  logging
+
+        The connection is kept open between polls; an existing socket is
+        reused and only replaced after a transfer error closed it.
+        """
+        if self.active_connection:
+            return True
+
         try:
             self.active_connection = socket.socket(
                 socket.AF_INET, socket.SOCK_STREAM)
             self.active_connection.settimeout(5)
+            # Disable Nagle so the small request/reply frames go out at once
+            self.active_connection.setsockopt(
+                socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Keepalive so a silently rebooted controller is detected instead
+            # of blocking the next poll on a dead peer
+            self.active_connection.setsockopt(
+                socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, 'TCP_KEEPIDLE'):
+                self.active_connection.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+            if hasattr(socket, 'TCP_KEEPINTVL'):
+                self.active_connection.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+            if hasattr(socket, 'TCP_KEEPCNT'):
+                self.active_connection.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+            # Roomy kernel buffers so a whole readout fits without the
+            # receive loop stalling on segment boundaries
+            self.active_connection.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+            self.active_connection.setsockopt(
+                socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+            # Busy-poll for replies where the platform supports it; the
+            # kernel may still refuse it (e.g. without CAP_NET_ADMIN), and
+            # a failed nice-to-have must not kill the connection
+            if hasattr(socket, 'SO_BUSY_POLL'):
+                with suppress(OSError):
+                    self.active_connection.setsockopt(
+                        socket.SOL_SOCKET, socket.SO_BUSY_POLL, 50)
             self.active_connection.connect((self.host, int(self.port)))
+            # Ask the kernel to ack immediately instead of delaying; cuts
+            # delayed-ACK stalls out of the request/reply ping-pong
+            if hasattr(socket, 'TCP_QUICKACK'):
+                self.active_connection.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
 
             if self.debug_level == DEBUG_ALL:
                 log_debug(f"Connected to {self.host}:{self.port} (Local: {self.active_connection.getsockname()})",
@@ -941,51 +1153,108 @@ class BasePlugin:
             log_debug(error_msg, DEBUG_CONN, self.debug_level)
             Domoticz.Error(error_msg)
 
-            if hasattr(self, 'active_connection') and self.active_connection:
-                self.active_connection.close()
-                self.active_connection = None
+            self._close_connection()
             return False
 
-    def send_message(self, command, address, value):
-        """Send message to heat pump with logging"""
-        try:
-            if self.debug_level == DEBUG_ALL:
-                log_debug(f"Sending {list(SOCKET_COMMANDS.keys())[list(SOCKET_COMMANDS.values()).index(command)]} command",
-                          DEBUG_PROTO, self.debug_level)
+    def _close_connection(self):
+        """Close the active connection, ignoring errors during teardown"""
+        if self.active_connection:
+            with suppress(OSError):
+                self.active_connection.close()
+            self.active_connection = None
 
-            # Send command and address
-            self.active_connection.send(struct.pack('!i', command))
-            self.active_connection.send(struct.pack('!i', address))
+    def _recv_exact(self, size: int) -> memoryview:
+        """Receive exactly size bytes into the reusable buffer.
 
-            # Handle write parameters
-            if command == SOCKET_COMMANDS['WRIT_PARAMS']:
-                self.active_connection.send(struct.pack('!i', value))
+        Loops recv_into until the requested byte count has arrived, growing
+        the buffer when a response is larger than its current capacity.
+        """
+        if size > len(self._recv_buf):
+            self._recv_buf = bytearray(size)
+        view = memoryview(self._recv_buf)
+        recv_into = self.active_connection.recv_into
+        received = 0
+        while received < size:
+            chunk = recv_into(view[received:size])
+            if chunk == 0:
+                raise ConnectionError(
+                    "Connection closed while receiving data")
+            received += chunk
+        return view[:size]
+
+    def _send_request(self, command, address, value):
+        """Write one request to the open connection"""
+        if self.debug_level == DEBUG_ALL:
+            log_debug(f"Sending {list(SOCKET_COMMANDS.keys())[list(SOCKET_COMMANDS.values()).index(command)]} command",
+                      DEBUG_PROTO, self.debug_level)
 
-            # Verify command echo
-            received_command = struct.unpack(
-                '!i', self.active_connection.recv(4))[0]
-            if received_command != command:
-                raise Exception(
-                    f"Command verification failed: sent {command}, received {received_command}")
+        # Send the whole request in one segment: command and address, plus
+        # the value for write commands
+        if command == _CMD_WRIT_PARAMS:
+            self.active_connection.sendall(
+                _INT32_3.pack(command, address, value))
+        else:
+            self.active_connection.sendall(_INT32_2.pack(command, address))
+
+    def _recv_response(self, command):
+        """Read one reply for command from the open connection"""
+        # The reply header has a known shape per command, so the command
+        # echo, stat and length words are fetched with a single recv
+        length = stat = 0
+        data_list = ()
+
+        if command == _CMD_READ_PARAMS:
+            received_command, length = _INT32_2.unpack(self._recv_exact(8))
+        elif command == _CMD_READ_CALCUL:
+            received_command, stat, length = _INT32_3.unpack(
+                self._recv_exact(12))
+        else:
+            received_command = _INT32.unpack(self._recv_exact(4))[0]
 
-            # Process response based on command type
-            length = stat = 0
-            data_list = []
+        # Verify command echo; a wrong echo means the stream is out of
+        # sync, which the retry path handles like any connection fault
+        if received_command != command:
+            raise ConnectionError(
+                f"Command verification failed: sent {command}, received {received_command}")
 
-            if command == SOCKET_COMMANDS['READ_PARAMS']:
-                length = struct.unpack('!i', self.active_connection.recv(4))[0]
-            elif command == SOCKET_COMMANDS['READ_CALCUL']:
-                stat = struct.unpack('!i', self.active_connection.recv(4))[0]
-                length = struct.unpack('!i', self.active_connection.recv(4))[0]
+        # Read the whole payload in one pass and decode it in one call; the
+        # unpacked tuple is kept as-is since consumers only index into it
+        if length > 0:
+            data_list = _payload_struct(length).unpack(
+                self._recv_exact(length * 4))
 
-            # Read data if expected
-            if length > 0:
-                data_list = [struct.unpack('!i', self.active_connection.recv(4))[
-                    0] for _ in range(length)]
+        return command, stat, length, data_list
 
-            return command, stat, length, data_list
+    def send_message(self, command, address, value):
+        """Send message to heat pump with logging"""
+        try:
+            self._send_request(command, address, value)
+            return self._recv_response(command)
 
-        except Exception as e:
+        except (OSError, struct.error) as e:
+            error_msg = f"Message send failed: {str(e)}"
+            log_debug(error_msg, DEBUG_PROTO, self.debug_level)
+            Domoticz.Error(error_msg)
+            return None
+
+    def send_poll_messages(self):
+        """Send both poll requests back-to-back and read both replies.
+
+        Pipelining READ_CALCUL and READ_PARAMS over the open connection
+        saves one full round trip per heartbeat; the controller answers
+        the requests in the order they were sent.
+        """
+        try:
+            for command_type in _POLL_COMMANDS:
+                self._send_request(SOCKET_COMMANDS[command_type], 0, 0)
+
+            results = {}
+            for command_type in _POLL_COMMANDS:
+                results[command_type] = self._recv_response(
+                    SOCKET_COMMANDS[command_type])
+            return results
+
+        except (OSError, struct.error) as e:
             error_msg = f"Message send failed: {str(e)}"
             log_debug(error_msg, DEBUG_PROTO, self.debug_level)
             Domoticz.Error(error_msg)
@@ -994,36 +1263,43 @@ class BasePlugin:
     def process_socket_message(self, command='READ_PARAMS', address=0, value=0):
         """Process socket messages with logging"""
         try:
-            # Validate command and parameters
-            if command not in SOCKET_COMMANDS:
+            # Validate the command and resolve its wire code in one lookup
+            try:
+                cmd_code = SOCKET_COMMANDS[command]
+            except KeyError:
                 raise ValueError(f"Invalid command: {command}")
 
             if command == 'WRIT_PARAMS':
-                if value not in self.available_writes[address].get_val():
+                write_param = self.available_writes[address]
+                if value not in write_param.get_val():
                     raise ValueError(
-                        f"Invalid value for {self.available_writes[address].get_name()}: {value}")
+                        f"Invalid value for {write_param.get_name()}: {value}")
             else:
                 address = value = 0
 
-            # Attempt communication with retries
+            # Attempt communication with retries; the connection stays open
+            # between polls and is only dropped after a failed transfer
             for attempt in range(2):
                 try:
+                    if attempt:
+                        # Full-jitter backoff so a busy controller is not
+                        # hammered with an immediate reconnect
+                        time.sleep(random.uniform(
+                            0, _RETRY_BACKOFF * 2 ** (attempt - 1)))
                     if self.initialize_connection():
-                        result = self.send_message(
-                            SOCKET_COMMANDS[command], address, value)
+                        result = self.send_message(cmd_code, address, value)
                         if result:
                             if self.debug_level == DEBUG_ALL:
                                 log_debug(
                                     f"{command}: Received {result[2]} values", DEBUG_PROTO, self.debug_level)
                             return result
+                    # Transfer failed - reconnect from scratch on retry
+                    self._close_connection()
                 except socket.error as e:
                     if attempt == 0:  # Only log first attempt failure
                         log_debug(
                             f"Socket error (retrying): {str(e)}", DEBUG_CONN, self.debug_level)
-                finally:
-                    if self.active_connection:
-                        self.active_connection.close()
-                        self.active_connection = None
+                    self._close_connection()
 
             raise Exception(f"Failed after 2 attempts")
 
@@ -1033,49 +1309,68 @@ class BasePlugin:
             Domoticz.Error(error_msg)
             return command, 0, 0, []
 
+    def process_poll_messages(self):
+        """Fetch both poll readouts in one pipelined exchange with retries"""
+        for attempt in range(2):
+            try:
+                if attempt:
+                    # Full-jitter backoff before the reconnect attempt
+                    time.sleep(random.uniform(
+                        0, _RETRY_BACKOFF * 2 ** (attempt - 1)))
+                if self.initialize_connection():
+                    results = self.send_poll_messages()
+                    if results:
+                        return results
+                # Transfer failed - reconnect from scratch on retry
+                self._close_connection()
+            except socket.error as e:
+                if attempt == 0:  # Only log first attempt failure
+                    log_debug(
+                        f"Socket error (retrying): {str(e)}", DEBUG_CONN, self.debug_level)
+                self._close_connection()
+
+        error_msg = "Socket message processing failed: Failed after 2 attempts"
+        log_debug(error_msg, DEBUG_PROTO, self.debug_level)
+        Domoticz.Error(error_msg)
+        return {}
+
     def update(self, message):
         """Update devices for a specific message type with accurate update counting"""
-        log_debug(
-            f"Starting update for message type: {message}", DEBUG_BASIC, self.debug_level)
+        # Bitmask checks at the call site keep the f-strings from being
+        # formatted when their debug category is off
+        if self.debug_level & DEBUG_BASIC:
+            log_debug(
+                f"Starting update for message type: {message}", DEBUG_BASIC, self.debug_level)
 
         try:
             # Process socket message
-            log_debug(
-                f"Processing socket message for {message}", DEBUG_PROTO, self.debug_level)
+            if self.debug_level & DEBUG_PROTO:
+                log_debug(
+                    f"Processing socket message for {message}", DEBUG_PROTO, self.debug_level)
             command, stat, data_length, data_list = self.process_socket_message(
                 message)
 
             if data_length > 0:
-                log_debug(
-                    f"Received {data_length} values to process", DEBUG_DATA, self.debug_level)
+                if self.debug_level & DEBUG_DATA:
+                    log_debug(
+                        f"Received {data_length} values to process", DEBUG_DATA, self.debug_level)
                 updates_count = 0
+                update_one = self._update_device
 
-                # Update each device
-                for device in self.dev_lists[message].values():
-                    try:
-                        # Create a copy of the device's current values
-                        old_nValue = Devices[device.id].nValue
-                        old_sValue = Devices[device.id].sValue
-
-                        # Update the device
-                        device.update_domoticz_dev(data_list)
-
-                        # Check if values actually changed
-                        if (Devices[device.id].nValue != old_nValue or
-                                Devices[device.id].sValue != old_sValue):
-                            updates_count += 1
-
-                    except Exception as e:
-                        error_msg = f"Error updating device {device.name}: {str(e)}"
-                        log_debug(error_msg, DEBUG_DEVICE, self.debug_level)
-                        Domoticz.Error(error_msg)
+                # Update each device; per-device isolation lives inside the
+                # helper so the loop body carries no exception frame
+                for device in self.poll_units[message]:
+                    if update_one(device, data_list):
+                        updates_count += 1
 
-                log_debug(f"{message}: Actually updated {updates_count} devices",
-                          DEBUG_DEVICE, self.debug_level)
+                if self.debug_level & DEBUG_DEVICE:
+                    log_debug(f"{message}: Actually updated {updates_count} devices",
+                              DEBUG_DEVICE, self.debug_level)
 
             else:
-                log_debug(
-                    f"No data received for message type: {message}", DEBUG_DATA, self.debug_level)
+                if self.debug_level & DEBUG_DATA:
+                    log_debug(
+                        f"No data received for message type: {message}", DEBUG_DATA, self.debug_level)
 
         except Exception as e:
             error_msg = f"Error in update method: {str(e)}"
@@ -1089,44 +1384,56 @@ class BasePlugin:
                       DEBUG_BASIC, self.debug_level)
 
         try:
-            for command_type in ['READ_CALCUL', 'READ_PARAMS']:
-                result = self.process_socket_message(command_type)
+            total_updates = 0
+            results = self.process_poll_messages()
+            for command_type in _POLL_COMMANDS:
+                result = results.get(command_type)
                 if result and result[2] > 0:  # If we got data
                     updates_count = 0
-                    for device in self.dev_lists[command_type].values():
-                        try:
-                            # Store current values
-                            old_nValue = Devices[device.id].nValue
-                            old_sValue = Devices[device.id].sValue
-
-                            # Update device
-                            if self._update_device(device, result[3]):
-                                # Check if values actually changed
-                                if (Devices[device.id].nValue != old_nValue or
-                                        Devices[device.id].sValue != old_sValue):
-                                    updates_count += 1
-
-                        except Exception as e:
-                            log_debug(f"Failed to update {device.name}: {str(e)}",
-                                      DEBUG_DEVICE, self.debug_level)
+                    data_list = result[3]
+                    update_one = self._update_device
+                    for device in self.poll_units[command_type]:
+                        if update_one(device, data_list):
+                            updates_count += 1
 
+                    total_updates += updates_count
                     if self.debug_level == DEBUG_ALL:
                         log_debug(f"{command_type}: Actually updated {updates_count} devices",
                                   DEBUG_BASIC, self.debug_level)
 
+            # Track stability so onHeartbeat can back off while nothing moves
+            if total_updates == 0:
+                self._stable_cycles += 1
+            else:
+                self._stable_cycles = 0
+            self._skip_next_poll = self._stable_cycles >= 3
+
         except Exception as e:
             error_msg = f"Update failed: {str(e)}"
             log_debug(error_msg, DEBUG_BASIC, self.debug_level)
             Domoticz.Error(error_msg)
 
     def _update_device(self, device, data_list):
-        """Helper method to update a single device"""
+        """Update a single device; returns True when its values changed.
+
+        The per-device exception isolation lives here, so the poll loops
+        pay for one handler per call instead of a try block per iteration.
+        """
         try:
-            device.update_domoticz_dev(data_list)
-            return True
+            devices = Devices
+            dom_dev = devices[device.id]
+            old_nValue = dom_dev.nValue
+            old_sValue = dom_dev.sValue
+
+            device.push_update(data_list)
+
+            dom_dev = devices[device.id]
+            return (dom_dev.nValue != old_nValue
+                    or dom_dev.sValue != old_sValue)
         except Exception as e:
-            log_debug(
-                f"Failed to update {device.name}: {str(e)}", DEBUG_DEVICE, self.debug_level)
+            error_msg = f"Failed to update {device.name}: {str(e)}"
+            log_debug(error_msg, DEBUG_DEVICE, self.debug_level)
+            Domoticz.Error(error_msg)
             return False
 
     def onStart(self):
@@ -1140,42 +1447,35 @@ class BasePlugin:
                 Domoticz.Debugging(1)
 
             if self.debug_level != DEBUG_NONE:
-                debug_categories = []
-                if self.debug_level & DEBUG_BASIC:
-                    debug_categories.append("Basic")
-                if self.debug_level & DEBUG_DEVICE:
-                    debug_categories.append("Device")
-                if self.debug_level & DEBUG_CONN:
-                    debug_categories.append("Connection")
-                if self.debug_level & DEBUG_PROTO:
-                    debug_categories.append("Protocol")
-                if self.debug_level & DEBUG_DATA:
-                    debug_categories.append("Data Processing")
+                # Decode the category names once and keep the label around
                 if self.debug_level == DEBUG_ALL:
-                    debug_categories = ["All"]
+                    self.debug_categories_label = "All"
+                else:
+                    self.debug_categories_label = ", ".join(
+                        name for category, name in _DEBUG_CATEGORY_NAMES
+                        if self.debug_level & category)
 
                 log_debug("Debug logging enabled with level: " +
                           str(self.debug_level), DEBUG_BASIC, self.debug_level)
                 log_debug("Enabled debug categories: " +
-                          ", ".join(debug_categories), DEBUG_BASIC, self.debug_level)
-                dump_config_to_log()
+                          self.debug_categories_label, DEBUG_BASIC, self.debug_level)
 
             # Initialize basic parameters first
             log_debug("Initializing plugin parameters",
                       DEBUG_BASIC, self.debug_level)
             self.name = Parameters['Name']
+            # Device names are "<plugin name> - <key>"; build the prefix once
+            self.name_prefix = f"{self.name} - "
             self.host = Parameters['Address']
             self.port = Parameters['Port']
 
             # Initialize translations and ranges
             log_debug("Initializing translation system",
                       DEBUG_BASIC, self.debug_level)
-            translations_data = {k: v for k,
-                                 v in TRANSLATIONS.items() if k != 'ranges'}
-            self.translation_manager.bulk_add_translations(translations_data)
-            if 'ranges' in TRANSLATIONS:
-                self.translation_manager.bulk_add_ranges(
-                    TRANSLATIONS['ranges'])
+            self.translation_manager.bulk_add_translations(
+                TRANSLATION_ENTRIES)
+            if TRANSLATION_RANGES:
+                self.translation_manager.bulk_add_ranges(TRANSLATION_RANGES)
             set_language(Parameters["Mode3"])
             self.translation_manager.initialize_debug(self.debug_level)
 
@@ -1214,11 +1514,10 @@ class BasePlugin:
         log_debug("Stopping plugin", DEBUG_BASIC, self.debug_level)
 
         try:
-            if hasattr(self, 'active_connection') and self.active_connection:
+            if self.active_connection is not None:
                 log_debug("Closing active connection",
                           DEBUG_CONN, self.debug_level)
-                self.active_connection.close()
-                self.active_connection = None
+                self._close_connection()
 
             log_debug("Plugin stopped successfully",
                       DEBUG_BASIC, self.debug_level)
@@ -1229,44 +1528,43 @@ class BasePlugin:
 
     def onConnect(self, Connection, status, Description):
         """Handle connection events"""
-        log_debug(f"Connection event:", DEBUG_CONN, self.debug_level)
-        log_debug(
-            f"  Address: {Connection.Address}:{Connection.Port}", DEBUG_CONN, self.debug_level)
-        log_debug(f"  Status: {status}", DEBUG_CONN, self.debug_level)
-        log_debug(f"  Description: {Description}",
-                  DEBUG_CONN, self.debug_level)
+        if self.debug_level & DEBUG_CONN:
+            log_debug(f"Connection event:\n"
+                      f"  Address: {Connection.Address}:{Connection.Port}\n"
+                      f"  Status: {status}\n"
+                      f"  Description: {Description}",
+                      DEBUG_CONN, self.debug_level)
 
     def onDisconnect(self, Connection):
         """Handle disconnection events"""
-        log_debug(f"Disconnect event:", DEBUG_CONN, self.debug_level)
-        log_debug(
-            f"  Address: {Connection.Address}:{Connection.Port}", DEBUG_CONN, self.debug_level)
+        if self.debug_level & DEBUG_CONN:
+            log_debug(f"Disconnect event:\n"
+                      f"  Address: {Connection.Address}:{Connection.Port}",
+                      DEBUG_CONN, self.debug_level)
 
     def onMessage(self, Connection, Data):
         """Handle incoming messages"""
-        log_debug(f"Message received:", DEBUG_PROTO, self.debug_level)
-        log_debug(f"  From: {Connection.Address}:{Connection.Port}",
-                  DEBUG_PROTO, self.debug_level)
-        log_debug(
-            f"  Data length: {len(Data) if Data else 0}", DEBUG_PROTO, self.debug_level)
+        if self.debug_level & DEBUG_PROTO:
+            log_debug(f"Message received:\n"
+                      f"  From: {Connection.Address}:{Connection.Port}\n"
+                      f"  Data length: {len(Data) if Data else 0}",
+                      DEBUG_PROTO, self.debug_level)
 
     def onCommand(self, Unit, Command, Level, Hue):
         """Handle command events"""
         try:
-            log_debug(f"Processing command:", DEBUG_PROTO, self.debug_level)
-            log_debug(f"  Unit: {Unit}", DEBUG_PROTO, self.debug_level)
-            log_debug(f"  Command: {Command}", DEBUG_PROTO, self.debug_level)
-            log_debug(f"  Level: {Level}", DEBUG_PROTO, self.debug_level)
-
-            # Prepare arguments
-            argument_list = locals()
-            argument_list.pop('self', None)
+            if self.debug_level & DEBUG_PROTO:
+                log_debug(f"Processing command:\n"
+                          f"  Unit: {Unit}\n"
+                          f"  Command: {Command}\n"
+                          f"  Level: {Level}",
+                          DEBUG_PROTO, self.debug_level)
 
             # Process command
             log_debug("Preparing data to send", DEBUG_PROTO, self.debug_level)
             command_data = self.dev_lists['WRIT_PARAMS'][Unit].prepare_data_to_send(
                 available_writes=self.available_writes,
-                **argument_list)
+                Unit=Unit, Command=Command, Level=Level, Hue=Hue)
 
             log_debug("Processing socket message",
                       DEBUG_PROTO, self.debug_level)
@@ -1286,11 +1584,26 @@ class BasePlugin:
 
     def onHeartbeat(self):
         """Handle heartbeat events with consolidated logging"""
+        if self._skip_next_poll:
+            # Values have been stable for a while; poll at half rate until
+            # something changes again
+            self._skip_next_poll = False
+            if self.debug_level == DEBUG_ALL:
+                log_debug("Values stable - skipping this poll cycle",
+                          DEBUG_BASIC, self.debug_level)
+            return
+
         if self.debug_level == DEBUG_ALL:
             log_debug("Heartbeat - Starting full device update",
                       DEBUG_BASIC, self.debug_level)
         self.update_all()
 
+        # One-shot configuration dump, moved off the startup critical path
+        if not self._config_dumped:
+            self._config_dumped = True
+            if self.debug_level != DEBUG_NONE:
+                dump_config_to_log()
+
     def onNotification(self, Name, Subject, Text, Status, Priority, Sound, ImageFile):
         """
         Handle notifications received by Domoticz.
@@ -1326,27 +1639,31 @@ class BasePlugin:
             Domoticz.Error(error_msg)
 
 
+_LANGUAGE_MAP = {
+    '0': Language.ENGLISH,
+    '1': Language.POLISH,
+    '2': Language.DUTCH,
+    '3': Language.GERMAN,
+    '4': Language.FRENCH
+}
+
+
 def set_language(language_code: str) -> None:
     """Set the current language based on plugin parameter"""
-    language_map = {
-        '0': Language.ENGLISH,
-        '1': Language.POLISH,
-        '2': Language.DUTCH,
-        '3': Language.GERMAN,
-        '4': Language.FRENCH
-    }
-    language = language_map.get(language_code)
+    language = _LANGUAGE_MAP.get(language_code)
     if language is None:
         log_debug(f"Invalid language code: {language_code}, defaulting to English", DEBUG_BASIC, _plugin.debug_level)
         language = Language.ENGLISH
     else:
         log_debug(f"Setting language to: {language.name}", DEBUG_BASIC, _plugin.debug_level)
     _plugin.translation_manager.set_language(language)
+    translate.cache_clear()
 
 
 
+@lru_cache(maxsize=None)
 def translate(key: str) -> str:
-    """Get translation for a key"""
+    """Get translation for a key (cached; cleared on language change)"""
     return _plugin.translation_manager.get(key)
 
 
@@ -1392,17 +1709,9 @@ def is_translatable_key(text: str) -> bool:
     Returns:
         bool: True if text is a translatable key or one of its translations
     """
-    # Check if text is a direct key in translations
-    if text in _plugin.translation_manager._translations:
-        return True
-
-    # Check if text is a translation value in any language
-    for translations in _plugin.translation_manager._translations.values():
-        for lang_value in translations.values():
-            if isinstance(lang_value, str) and text == lang_value:
-                return True
-
-    return False
+    # The reverse index covers both the canonical keys and every
+    # translation value, so this is a single hash lookup
+    return text in _plugin.translation_manager._reverse
 
 
 global _plugin
@@ -1450,6 +1759,23 @@ def onHeartbeat():
     _plugin.onHeartbeat()
 
 
+# Optional metadata parameters handled by update_device, paired with the
+# device attribute they are compared against (None when the device has no
+# readable counterpart)
+_OPT_PARAMS = (
+    ('Image', 'Image'),
+    ('SignalLevel', 'SignalLevel'),
+    ('BatteryLevel', 'BatteryLevel'),
+    ('Options', 'Options'),
+    ('TimedOut', 'TimedOut'),
+    ('Type', 'Type'),
+    ('Subtype', None),
+    ('Switchtype', 'Switchtype'),
+    ('Description', 'Description'),
+    ('Color', 'Color'),
+)
+
+
 def update_device(Unit: int = None, nValue: int = None, sValue: str = None, Image: int = None,
                   SignalLevel: int = None, BatteryLevel: int = None, Options: dict = None,
                   TimedOut: int = None, Name: str = None, TypeName: str = None,
@@ -1460,6 +1786,13 @@ def update_device(Unit: int = None, nValue: int = None, sValue: str = None, Imag
     Delegates numeric (or text) change comparison to DeviceUpdateTracker and logs a combined update message.
     """
 
+    # Bail out before touching the device when the caller passed nothing
+    if all(arg is None for arg in (nValue, sValue, Image, SignalLevel,
+                                   BatteryLevel, Options, TimedOut, Name,
+                                   TypeName, Type, Subtype, Switchtype,
+                                   Used, Description, Color)):
+        return
+
     # Ensure the device exists.
     if Unit not in Devices:
         log_debug(f"Device {Unit} not found - attempting to recreate devices",
@@ -1471,69 +1804,67 @@ def update_device(Unit: int = None, nValue: int = None, sValue: str = None, Imag
 
     device = Devices[Unit]
 
-    # Build update arguments from the current state.
+    # Build update arguments, falling back to the current state only for
+    # values the caller did not supply.
     largs = {
-        "nValue": device.nValue if device.nValue is not None else 0,
-        "sValue": str(device.sValue) if device.sValue is not None else ""
+        "nValue": nValue if nValue is not None
+        else (device.nValue if device.nValue is not None else 0),
+        # sValue is already a string both from the callbacks and the device
+        "sValue": sValue if sValue is not None else (device.sValue or "")
     }
 
-    # Overwrite with new numeric values if provided.
-    if nValue is not None:
-        largs["nValue"] = nValue
-    if sValue is not None:
-        largs["sValue"] = str(sValue)
-
     # Process additional metadata parameters and track any differences.
+    # The common per-heartbeat call passes only nValue/sValue, so the
+    # attribute walk is skipped entirely unless metadata was supplied.
+    # The diff strings are only read by the DEBUG_DEVICE log below, so
+    # skip formatting them when that category is off; meta_changed keeps
+    # the "anything to write" decision independent of debug state
+    debug_device = bool(_plugin.debug_level & DEBUG_DEVICE)
+    meta_changed = False
     metadata_changes = []
-    param_updates = {
-        'Image': (Image, device.Image),
-        'SignalLevel': (SignalLevel, device.SignalLevel),
-        'BatteryLevel': (BatteryLevel, device.BatteryLevel),
-        'Options': (Options, device.Options),
-        'TimedOut': (TimedOut, device.TimedOut),
-        'Type': (Type, device.Type),
-        'Subtype': (Subtype, None),
-        'Switchtype': (Switchtype, getattr(device, 'Switchtype', None)),
-        'Description': (Description, device.Description),
-        'Color': (Color, device.Color)
-    }
-
-    for param_name, (new_value, current_value) in param_updates.items():
-        if new_value is not None and new_value != current_value:
-            largs[param_name] = new_value
-            metadata_changes.append(
-                f"{param_name}: {current_value} -> {new_value}")
+    passed_values = (Image, SignalLevel, BatteryLevel, Options, TimedOut,
+                     Type, Subtype, Switchtype, Description, Color)
+    if any(value is not None for value in passed_values):
+        for (param_name, attr_name), new_value in zip(_OPT_PARAMS, passed_values):
+            if new_value is None:
+                continue
+            current_value = (getattr(device, attr_name, None)
+                             if attr_name else None)
+            if new_value != current_value:
+                largs[param_name] = new_value
+                meta_changed = True
+                if debug_device:
+                    metadata_changes.append(
+                        f"{param_name}: {current_value} -> {new_value}")
 
     # Handle name updates (with translation) if applicable.
     if Name is not None and Name != device.Name:
-        current_name = (device.Name.replace(f"{Parameters['Name']} - ", "")
-                        if f"{Parameters['Name']} - " in device.Name
-                        else device.Name)
+        name_prefix = _plugin.name_prefix
+        current_name = device.Name.removeprefix(name_prefix)
         if is_translatable_key(current_name):
-            new_name = f"{Parameters['Name']} - {Name}"
+            new_name = name_prefix + Name
             largs["Name"] = new_name
-            metadata_changes.append(f"Name: {current_name} -> {Name}")
+            meta_changed = True
+            if debug_device:
+                metadata_changes.append(f"Name: {current_name} -> {Name}")
 
     # Use the DeviceUpdateTracker to decide whether the device values have changed.
-    if not hasattr(_plugin, 'update_tracker'):
-        _plugin.update_tracker = DeviceUpdateTracker()
-
     needs_update, update_reason, diff_message = _plugin.update_tracker.needs_update(
-        device,
-        {'nValue': largs['nValue'], 'sValue': largs['sValue']}
-    )
+        device, largs['nValue'], largs['sValue'])
 
     # Build and log a combined message that includes update decision, diff info, and metadata changes.
-    if _plugin.debug_level & DEBUG_DEVICE:
-        combined_message = f"Update decision for Device {Unit} ({device.Name}): {update_reason}"
+    if debug_device:
+        parts = [
+            f"Update decision for Device {Unit} ({device.Name}): {update_reason}"]
         if diff_message:
-            combined_message += f" -- {diff_message}"
+            parts.append(f" -- {diff_message}")
         if metadata_changes:
-            combined_message += f" | Metadata changes: {', '.join(metadata_changes)}"
-        log_debug(combined_message, DEBUG_DEVICE, _plugin.debug_level)
+            parts.append(
+                f" | Metadata changes: {', '.join(metadata_changes)}")
+        log_debug(''.join(parts), DEBUG_DEVICE, _plugin.debug_level)
 
     # Update the device only if needed.
-    if needs_update or metadata_changes:
+    if needs_update or meta_changed:
         try:
             Devices[Unit].Update(**largs)
         except Exception as e:
@@ -1541,20 +1872,27 @@ def update_device(Unit: int = None, nValue: int = None, sValue: str = None, Imag
                 f"Error updating device {Unit} ({device.Name}): {str(e)}")
 
 
+# Optional device attributes included in the configuration dump, in the
+# order they should appear
+_OPTIONAL_ATTRS = ('LastLevel', 'Image', 'SignalLevel',
+                   'BatteryLevel', 'Used', 'Description')
+
+
 def dump_config_to_log():
     """Dump plugin configuration and device states to log with detailed formatting"""
-    log_debug("=== Plugin Configuration ===", DEBUG_BASIC, _plugin.debug_level)
-
-    # Log parameters
-    log_debug("Parameters:", DEBUG_BASIC, _plugin.debug_level)
+    # Collect the whole dump and emit it in one log call per section so the
+    # output doesn't cross the plugin API boundary once per line
+    # The final log_debug call would drop the dump anyway when DEBUG_BASIC
+    # is off, so bail out before walking every parameter and device
+    if not (_plugin.debug_level & DEBUG_BASIC):
+        return
+
+    lines = ["=== Plugin Configuration ===", "Parameters:"]
     for param_name, param_value in Parameters.items():
         if param_value:
-            log_debug(f"  {param_name}: {param_value}",
-                      DEBUG_BASIC, _plugin.debug_level)
+            lines.append(f"  {param_name}: {param_value}")
 
-    # Log devices
-    log_debug(
-        f"\nRegistered Devices ({len(Devices)}):", DEBUG_BASIC, _plugin.debug_level)
+    lines.append(f"\nRegistered Devices ({len(Devices)}):")
 
     for device_unit, device in Devices.items():
         try:
@@ -1566,25 +1904,27 @@ def dump_config_to_log():
                 'State': f"nValue={device.nValue}, sValue={device.sValue}"
             }
 
-            # Add optional attributes if they exist and have values
-            for attr in ['LastLevel', 'Image', 'SignalLevel', 'BatteryLevel', 'Used', 'Description']:
-                if hasattr(device, attr):
+            # Add optional attributes if they exist and have values; one
+            # dir() snapshot replaces an exception-catching hasattr per
+            # attribute
+            present = set(dir(device))
+            for attr in _OPTIONAL_ATTRS:
+                if attr in present:
                     value = getattr(device, attr)
                     if value is not None and (not isinstance(value, str) or value.strip()):
                         device_info[attr] = value
 
             # Add options if they exist and aren't empty
-            if hasattr(device, 'Options') and device.Options:
+            if 'Options' in present and device.Options:
                 device_info['Options'] = device.Options
 
             # Format all info into a single line
             info_str = ', '.join(f"{k}: {v}" for k, v in device_info.items())
-            log_debug(f"Device {device_unit}: {info_str}",
-                      DEBUG_BASIC, _plugin.debug_level)
+            lines.append(f"Device {device_unit}: {info_str}")
 
         except Exception as e:
-            log_debug(
-                f"Error dumping config for device {device_unit}: {str(e)}", DEBUG_BASIC, _plugin.debug_level)
+            lines.append(
+                f"Error dumping config for device {device_unit}: {str(e)}")
 
-    log_debug("\n=== End Configuration Dump ===",
-              DEBUG_BASIC, _plugin.debug_level)
+    lines.append("\n=== End Configuration Dump ===")
+    log_debug('\n'.join(lines), DEBUG_BASIC, _plugin.debug_level)
@@ -1,4 +1,6 @@
+import sys
 from enum import Enum, auto
+from types import MappingProxyType
 
 class Language(Enum):
     """Supported languages"""
@@ -381,140 +383,81 @@ TRANSLATIONS = {
     # Ranges (detailed descriptions, no length limit)
     'ranges': {
         'superheat': {
-            Language.ENGLISH: {
-                'description': 'Optimal range: 5-8K\n• <3K: Critical Low (Compressor risk)\n• 3-5K: Low\n• 5-8K: Normal\n• 8-10K: High\n• >10K: Critical High',
-            },
-            Language.POLISH: {
-                'description': 'Zakres optymalny: 5-8K\n• <3K: Krytycznie niski (ryzyko sprężarki)\n• 3-5K: Niski\n• 5-8K: Normalny\n• 8-10K: Wysoki\n• >10K: Krytycznie wysoki',
-            },
-            Language.DUTCH: {
-                'description': 'Optimaal bereik: 5-8K\n• <3K: Kritisch laag (compressor risico)\n• 3-5K: Laag\n• 5-8K: Normaal\n• 8-10K: Hoog\n• >10K: Kritisch hoog',
-            },
-            Language.GERMAN: {
-                'description': 'Optimalbereich: 5-8K\n• <3K: Kritisch niedrig (Kompressorrisiko)\n• 3-5K: Niedrig\n• 5-8K: Normal\n• 8-10K: Hoch\n• >10K: Kritisch hoch',
-            },
-            Language.FRENCH: {
-                'description': 'Plage optimale: 5-8K\n• <3K: Critiquement bas (risque pour le compresseur)\n• 3-5K: Bas\n• 5-8K: Normal\n• 8-10K: Élevé\n• >10K: Critiquement élevé',
-            }
+            Language.ENGLISH: 'Optimal range: 5-8K\n• <3K: Critical Low (Compressor risk)\n• 3-5K: Low\n• 5-8K: Normal\n• 8-10K: High\n• >10K: Critical High',
+            Language.POLISH: 'Zakres optymalny: 5-8K\n• <3K: Krytycznie niski (ryzyko sprężarki)\n• 3-5K: Niski\n• 5-8K: Normalny\n• 8-10K: Wysoki\n• >10K: Krytycznie wysoki',
+            Language.DUTCH: 'Optimaal bereik: 5-8K\n• <3K: Kritisch laag (compressor risico)\n• 3-5K: Laag\n• 5-8K: Normaal\n• 8-10K: Hoog\n• >10K: Kritisch hoog',
+            Language.GERMAN: 'Optimalbereich: 5-8K\n• <3K: Kritisch niedrig (Kompressorrisiko)\n• 3-5K: Niedrig\n• 5-8K: Normal\n• 8-10K: Hoch\n• >10K: Kritisch hoch',
+            Language.FRENCH: 'Plage optimale: 5-8K\n• <3K: Critiquement bas (risque pour le compresseur)\n• 3-5K: Bas\n• 5-8K: Normal\n• 8-10K: Élevé\n• >10K: Critiquement élevé'
         },
         'pressure_high': {
-            Language.ENGLISH: {
-                'description': 'Optimal range: 16-23 bar\n• <16 bar: Low (Check refrigerant)\n• 16-23 bar: Normal\n• 23-28 bar: High\n• >28 bar: Critical (System shutdown)',
-            },
-            Language.POLISH: {
-                'description': 'Zakres optymalny: 16-23 bar\n• <16 bar: Niskie (Sprawdź czynnik)\n• 16-23 bar: Normalne\n• 23-28 bar: Wysokie\n• >28 bar: Krytyczne (Wyłączenie)',
-            },
-            Language.DUTCH: {
-                'description': 'Optimaal bereik: 16-23 bar\n• <16 bar: Laag (Controleer koudemiddel)\n• 16-23 bar: Normaal\n• 23-28 bar: Hoog\n• >28 bar: Kritisch (Systeem stop)',
-            },
-            Language.GERMAN: {
-                'description': 'Optimalbereich: 16-23 bar\n• <16 bar: Niedrig (Kältemittel prüfen)\n• 16-23 bar: Normal\n• 23-28 bar: Hoch\n• >28 bar: Kritisch (Systemabschaltung)',
-            },
-            Language.FRENCH: {
-                'description': 'Plage optimale: 16-23 bar\n• <16 bar: Faible (vérifier le réfrigérant)\n• 16-23 bar: Normal\n• 23-28 bar: Élevé\n• >28 bar: Critique (arrêt du système)',
-            }
+            Language.ENGLISH: 'Optimal range: 16-23 bar\n• <16 bar: Low (Check refrigerant)\n• 16-23 bar: Normal\n• 23-28 bar: High\n• >28 bar: Critical (System shutdown)',
+            Language.POLISH: 'Zakres optymalny: 16-23 bar\n• <16 bar: Niskie (Sprawdź czynnik)\n• 16-23 bar: Normalne\n• 23-28 bar: Wysokie\n• >28 bar: Krytyczne (Wyłączenie)',
+            Language.DUTCH: 'Optimaal bereik: 16-23 bar\n• <16 bar: Laag (Controleer koudemiddel)\n• 16-23 bar: Normaal\n• 23-28 bar: Hoog\n• >28 bar: Kritisch (Systeem stop)',
+            Language.GERMAN: 'Optimalbereich: 16-23 bar\n• <16 bar: Niedrig (Kältemittel prüfen)\n• 16-23 bar: Normal\n• 23-28 bar: Hoch\n• >28 bar: Kritisch (Systemabschaltung)',
+            Language.FRENCH: 'Plage optimale: 16-23 bar\n• <16 bar: Faible (vérifier le réfrigérant)\n• 16-23 bar: Normal\n• 23-28 bar: Élevé\n• >28 bar: Critique (arrêt du système)'
         },
         'pressure_low': {
-            Language.ENGLISH: {
-                'description': 'Optimal range: 4.5-6 bar\n• <3 bar: Critical (Leak check)\n• 3-4.5 bar: Low\n• 4.5-6 bar: Normal\n• >6 bar: High (Check expansion valve)',
-            },
-            Language.POLISH: {
-                'description': 'Zakres optymalny: 4.5-6 bar\n• <3 bar: Krytyczne (Sprawdź szczelność)\n• 3-4.5 bar: Niskie\n• 4.5-6 bar: Normalne\n• >6 bar: Wysokie (Sprawdź zawór)',
-            },
-            Language.DUTCH: {
-                'description': 'Optimaal bereik: 4.5-6 bar\n• <3 bar: Kritisch (Controleer lekkage)\n• 3-4.5 bar: Laag\n• 4.5-6 bar: Normaal\n• >6 bar: Hoog (Controleer expansieventiel)',
-            },
-            Language.GERMAN: {
-                'description': 'Optimalbereich: 4.5-6 bar\n• <3 bar: Kritisch (Lecksuche)\n• 3-4.5 bar: Niedrig\n• 4.5-6 bar: Normal\n• >6 bar: Hoch (Expansionsventil prüfen)',
-            },
-            Language.FRENCH: {
-                'description': 'Plage optimale: 4.5-6 bar\n• <3 bar: Critique (vérifier les fuites)\n• 3-4.5 bar: Faible\n• 4.5-6 bar: Normal\n• >6 bar: Élevé (vérifier la vanne d\'expansion)',
-            }
+            Language.ENGLISH: 'Optimal range: 4.5-6 bar\n• <3 bar: Critical (Leak check)\n• 3-4.5 bar: Low\n• 4.5-6 bar: Normal\n• >6 bar: High (Check expansion valve)',
+            Language.POLISH: 'Zakres optymalny: 4.5-6 bar\n• <3 bar: Krytyczne (Sprawdź szczelność)\n• 3-4.5 bar: Niskie\n• 4.5-6 bar: Normalne\n• >6 bar: Wysokie (Sprawdź zawór)',
+            Language.DUTCH: 'Optimaal bereik: 4.5-6 bar\n• <3 bar: Kritisch (Controleer lekkage)\n• 3-4.5 bar: Laag\n• 4.5-6 bar: Normaal\n• >6 bar: Hoog (Controleer expansieventiel)',
+            Language.GERMAN: 'Optimalbereich: 4.5-6 bar\n• <3 bar: Kritisch (Lecksuche)\n• 3-4.5 bar: Niedrig\n• 4.5-6 bar: Normal\n• >6 bar: Hoch (Expansionsventil prüfen)',
+            Language.FRENCH: 'Plage optimale: 4.5-6 bar\n• <3 bar: Critique (vérifier les fuites)\n• 3-4.5 bar: Faible\n• 4.5-6 bar: Normal\n• >6 bar: Élevé (vérifier la vanne d\'expansion)'
         },
         'hot_gas': {
-            Language.ENGLISH: {
-                'description': 'Optimal range: <85°C\n• <85°C: Normal\n• 85-95°C: High (Monitor system)\n• >95°C: Critical (Risk of damage)',
-            },
-            Language.POLISH: {
-                'description': 'Zakres optymalny: <85°C\n• <85°C: Normalny\n• 85-95°C: Wysoki (Monitoruj)\n• >95°C: Krytyczny (Ryzyko uszkodzenia)',
-            },
-            Language.DUTCH: {
-                'description': 'Optimaal bereik: <85°C\n• <85°C: Normaal\n• 85-95°C: Hoog (Monitor systeem)\n• >95°C: Kritisch (Risico op schade)',
-            },
-            Language.GERMAN: {
-                'description': 'Optimalbereich: <85°C\n• <85°C: Normal\n• 85-95°C: Hoch (System überwachen)\n• >95°C: Kritisch (Schadensgefahr)',
-            },
-            Language.FRENCH: {
-                'description': 'Plage optimale: <85°C\n• <85°C: Normal\n• 85-95°C: Élevé (surveiller le système)\n• >95°C: Critique (risque de dommage)',
-            }
+            Language.ENGLISH: 'Optimal range: <85°C\n• <85°C: Normal\n• 85-95°C: High (Monitor system)\n• >95°C: Critical (Risk of damage)',
+            Language.POLISH: 'Zakres optymalny: <85°C\n• <85°C: Normalny\n• 85-95°C: Wysoki (Monitoruj)\n• >95°C: Krytyczny (Ryzyko uszkodzenia)',
+            Language.DUTCH: 'Optimaal bereik: <85°C\n• <85°C: Normaal\n• 85-95°C: Hoog (Monitor systeem)\n• >95°C: Kritisch (Risico op schade)',
+            Language.GERMAN: 'Optimalbereich: <85°C\n• <85°C: Normal\n• 85-95°C: Hoch (System überwachen)\n• >95°C: Kritisch (Schadensgefahr)',
+            Language.FRENCH: 'Plage optimale: <85°C\n• <85°C: Normal\n• 85-95°C: Élevé (surveiller le système)\n• >95°C: Critique (risque de dommage)'
         },
         'cop': {
-            Language.ENGLISH: {
-                'description': 'Expected range: 4.0-4.5\n• <3.5: Poor efficiency\n• 3.5-4.0: Low\n• 4.0-4.5: Normal\n• 4.5-5.0: Good\n• >5.0: Excellent',
-            },
-            Language.POLISH: {
-                'description': 'Zakres oczekiwany: 4.0-4.5\n• <3.5: Słaba wydajność\n• 3.5-4.0: Niska\n• 4.0-4.5: Normalna\n• 4.5-5.0: Dobra\n• >5.0: Doskonała',
-            },
-            Language.DUTCH: {
-                'description': 'Verwacht bereik: 4.0-4.5\n• <3.5: Slechte efficiëntie\n• 3.5-4.0: Laag\n• 4.0-4.5: Normaal\n• 4.5-5.0: Goed\n• >5.0: Uitstekend',
-            },
-            Language.GERMAN: {
-                'description': 'Erwarteter Bereich: 4.0-4.5\n• <3.5: Schlechte Effizienz\n• 3.5-4.0: Niedrig\n• 4.0-4.5: Normal\n• 4.5-5.0: Gut\n• >5.0: Hervorragend',
-            },
-            Language.FRENCH: {
-                'description': 'Plage attendue: 4.0-4.5\n• <3.5: Faible efficacité\n• 3.5-4.0: Bas\n• 4.0-4.5: Normal\n• 4.5-5.0: Bon\n• >5.0: Excellent',
-            }
+            Language.ENGLISH: 'Expected range: 4.0-4.5\n• <3.5: Poor efficiency\n• 3.5-4.0: Low\n• 4.0-4.5: Normal\n• 4.5-5.0: Good\n• >5.0: Excellent',
+            Language.POLISH: 'Zakres oczekiwany: 4.0-4.5\n• <3.5: Słaba wydajność\n• 3.5-4.0: Niska\n• 4.0-4.5: Normalna\n• 4.5-5.0: Dobra\n• >5.0: Doskonała',
+            Language.DUTCH: 'Verwacht bereik: 4.0-4.5\n• <3.5: Slechte efficiëntie\n• 3.5-4.0: Laag\n• 4.0-4.5: Normaal\n• 4.5-5.0: Goed\n• >5.0: Uitstekend',
+            Language.GERMAN: 'Erwarteter Bereich: 4.0-4.5\n• <3.5: Schlechte Effizienz\n• 3.5-4.0: Niedrig\n• 4.0-4.5: Normal\n• 4.5-5.0: Gut\n• >5.0: Hervorragend',
+            Language.FRENCH: 'Plage attendue: 4.0-4.5\n• <3.5: Faible efficacité\n• 3.5-4.0: Bas\n• 4.0-4.5: Normal\n• 4.5-5.0: Bon\n• >5.0: Excellent'
         },
         'pump_speed': {
-            Language.ENGLISH: {
-                'description': 'Normal range: 40-80%\n• <40%: Low (Check flow)\n• 40-80%: Normal operation\n• >80%: High (Check system load)',
-            },
-            Language.POLISH: {
-                'description': 'Zakres normalny: 40-80%\n• <40%: Niski (Sprawdź przepływ)\n• 40-80%: Normalna praca\n• >80%: Wysoki (Sprawdź obciążenie)',
-            },
-            Language.DUTCH: {
-                'description': 'Normaal bereik: 40-80%\n• <40%: Laag (Controleer flow)\n• 40-80%: Normale werking\n• >80%: Hoog (Controleer belasting)',
-            },
-            Language.GERMAN: {
-                'description': 'Normalbereich: 40-80%\n• <40%: Niedrig (Durchfluss prüfen)\n• 40-80%: Normalbetrieb\n• >80%: Hoch (Systemlast prüfen)',
-            },
-            Language.FRENCH: {
-                'description': 'Plage normale: 40-80%\n• <40%: Faible (vérifier le débit)\n• 40-80%: Normal\n• >80%: Élevé (vérifier la charge du système)',
-            }
+            Language.ENGLISH: 'Normal range: 40-80%\n• <40%: Low (Check flow)\n• 40-80%: Normal operation\n• >80%: High (Check system load)',
+            Language.POLISH: 'Zakres normalny: 40-80%\n• <40%: Niski (Sprawdź przepływ)\n• 40-80%: Normalna praca\n• >80%: Wysoki (Sprawdź obciążenie)',
+            Language.DUTCH: 'Normaal bereik: 40-80%\n• <40%: Laag (Controleer flow)\n• 40-80%: Normale werking\n• >80%: Hoog (Controleer belasting)',
+            Language.GERMAN: 'Normalbereich: 40-80%\n• <40%: Niedrig (Durchfluss prüfen)\n• 40-80%: Normalbetrieb\n• >80%: Hoch (Systemlast prüfen)',
+            Language.FRENCH: 'Plage normale: 40-80%\n• <40%: Faible (vérifier le débit)\n• 40-80%: Normal\n• >80%: Élevé (vérifier la charge du système)'
         },
         'brine_temp_diff': {
-            Language.ENGLISH: {
-                'description': 'Optimal range: 3-4K\n• <2K: Low (Flow too high)\n• 2-3K: Low efficiency\n• 3-4K: Normal\n• >4K: High (Check flow rate)',
-            },
-            Language.POLISH: {
-                'description': 'Zakres optymalny: 3-4K\n• <2K: Niski (Za wysoki przepływ)\n• 2-3K: Niska wydajność\n• 3-4K: Normalny\n• >4K: Wysoki (Sprawdź przepływ)',
-            },
-            Language.DUTCH: {
-                'description': 'Optimaal bereik: 3-4K\n• <2K: Laag (Flow te hoog)\n• 2-3K: Lage efficiëntie\n• 3-4K: Normaal\n• >4K: Hoog (Controleer flow)',
-            },
-            Language.GERMAN: {
-                'description': 'Optimalbereich: 3-4K\n• <2K: Niedrig (Zu hoher Durchfluss)\n• 2-3K: Geringe Effizienz\n• 3-4K: Normal\n• >4K: Hoch (Durchflussrate prüfen)',
-            },
-            Language.FRENCH: {
-                'description': 'Plage optimale: 3-4K\n• <2K: Faible (débit trop élevé)\n• 2-3K: Faible efficacité\n• 3-4K: Normal\n• >4K: Élevé (vérifier le débit)',
-            }
+            Language.ENGLISH: 'Optimal range: 3-4K\n• <2K: Low (Flow too high)\n• 2-3K: Low efficiency\n• 3-4K: Normal\n• >4K: High (Check flow rate)',
+            Language.POLISH: 'Zakres optymalny: 3-4K\n• <2K: Niski (Za wysoki przepływ)\n• 2-3K: Niska wydajność\n• 3-4K: Normalny\n• >4K: Wysoki (Sprawdź przepływ)',
+            Language.DUTCH: 'Optimaal bereik: 3-4K\n• <2K: Laag (Flow te hoog)\n• 2-3K: Lage efficiëntie\n• 3-4K: Normaal\n• >4K: Hoog (Controleer flow)',
+            Language.GERMAN: 'Optimalbereich: 3-4K\n• <2K: Niedrig (Zu hoher Durchfluss)\n• 2-3K: Geringe Effizienz\n• 3-4K: Normal\n• >4K: Hoch (Durchflussrate prüfen)',
+            Language.FRENCH: 'Plage optimale: 3-4K\n• <2K: Faible (débit trop élevé)\n• 2-3K: Faible efficacité\n• 3-4K: Normal\n• >4K: Élevé (vérifier le débit)'
         },
         'heating_temp_diff': {
-            Language.ENGLISH: {
-                'description': 'Optimal range: 5-7K\n• <4K: Low (Flow too high)\n• 4-5K: Low efficiency\n• 5-7K: Normal\n• >7K: High (Check flow rate)',
-            },
-            Language.POLISH: {
-                'description': 'Zakres optymalny: 5-7K\n• <4K: Niski (Za wysoki przepływ)\n• 4-5K: Niska wydajność\n• 5-7K: Normalny\n• >7K: Wysoki (Sprawdź przepływ)',
-            },
-            Language.DUTCH: {
-                'description': 'Optimaal bereik: 5-7K\n• <4K: Laag (Flow te hoog)\n• 4-5K: Lage efficiëntie\n• 5-7K: Normaal\n• >7K: Hoog (Controleer flow)',
-            },
-            Language.GERMAN: {
-                'description': 'Optimalbereich: 5-7K\n• <4K: Niedrig (Zu hoher Durchfluss)\n• 4-5K: Geringe Effizienz\n• 5-7K: Normal\n• >7K: Hoch (Durchflussrate prüfen)',
-            },
-            Language.FRENCH: {
-                'description': 'Plage optimale: 5-7K\n• <4K: Faible (débit trop élevé)\n• 4-5K: Faible efficacité\n• 5-7K: Normal\n• >7K: Élevé (vérifier le débit)',
-            }
+            Language.ENGLISH: 'Optimal range: 5-7K\n• <4K: Low (Flow too high)\n• 4-5K: Low efficiency\n• 5-7K: Normal\n• >7K: High (Check flow rate)',
+            Language.POLISH: 'Zakres optymalny: 5-7K\n• <4K: Niski (Za wysoki przepływ)\n• 4-5K: Niska wydajność\n• 5-7K: Normalny\n• >7K: Wysoki (Sprawdź przepływ)',
+            Language.DUTCH: 'Optimaal bereik: 5-7K\n• <4K: Laag (Flow te hoog)\n• 4-5K: Lage efficiëntie\n• 5-7K: Normaal\n• >7K: Hoog (Controleer flow)',
+            Language.GERMAN: 'Optimalbereich: 5-7K\n• <4K: Niedrig (Zu hoher Durchfluss)\n• 4-5K: Geringe Effizienz\n• 5-7K: Normal\n• >7K: Hoch (Durchflussrate prüfen)',
+            Language.FRENCH: 'Plage optimale: 5-7K\n• <4K: Faible (débit trop élevé)\n• 4-5K: Faible efficacité\n• 5-7K: Normal\n• >7K: Élevé (vérifier le débit)'
         }
     }
 }
+
+
+# Split the table once at import time so the plugin does not have to
+# special-case the 'ranges' key on every startup. Keys and the short
+# translated names are interned: identical strings (untranslated entries,
+# names shared across languages) collapse to one object and equality
+# checks become pointer compares. The multi-line range descriptions are
+# left alone - they never repeat and are compared nowhere.
+TRANSLATION_ENTRIES = {
+    sys.intern(key): {language: sys.intern(value)
+                      for language, value in entry.items()}
+    for key, entry in TRANSLATIONS.items() if key != 'ranges'
+}
+TRANSLATION_RANGES = TRANSLATIONS.get('ranges', {})
+
+# Freeze the top-level tables against accidental mutation; the per-entry
+# dicts stay plain because the TranslationManager fills in a missing
+# English form when registering an entry
+TRANSLATIONS = MappingProxyType(TRANSLATIONS)
+TRANSLATION_ENTRIES = MappingProxyType(TRANSLATION_ENTRIES)
+TRANSLATION_RANGES = MappingProxyType(TRANSLATION_RANGES)